@@ -1,4 +1,5 @@
 import streamlit as st
+from config.feature_config import BULK_IMPORT_ENABLED
 from styles.custom_css import load_custom_css
 from components.auth_page import auth_page
 from components.sidebar import render_sidebar
@@ -11,6 +12,7 @@ from components.notes_page import notes_page
 from components.bookmarks_page import bookmarks_page
 from components.profile_page import profile_page
 from components.settings_page import settings_page
+from components.bulk_import_page import bulk_import_page
 
 # ========================================
 # SESSION STATE INITIALIZATION
@@ -55,6 +57,8 @@ def main_app():
         profile_page()
     elif active == "Settings":
         settings_page()
+    elif active == "Bulk Import" and BULK_IMPORT_ENABLED:
+        bulk_import_page()
     else:
         dashboard_page()
 
@@ -1,7 +1,39 @@
 import streamlit as st
+from utils.attempt_store import sync_attempts
+from utils.attempt_stats import get_stats, average_score
+from components.export_section import render_export_section
 
 
 def analytics_page():
     """Analytics page"""
     st.markdown("<h1>📈 Analytics</h1>", unsafe_allow_html=True)
     st.markdown("View your performance analytics.")
+
+    user = st.session_state.user_data
+    stats_slot = st.empty()
+    with stats_slot.container():
+        _render_summary(get_stats(user.get('user_id')))
+
+    st.markdown("---")
+    render_export_section("analytics")
+
+    # Refresh from the API only after the page has rendered
+    new_attempts = sync_attempts(user.get('user_id'))
+    if new_attempts:
+        with stats_slot.container():
+            _render_summary(get_stats(user.get('user_id')))
+    elif new_attempts is None:
+        st.caption("Couldn't refresh your results right now. Showing saved stats.")
+
+
+def _render_summary(stats):
+    """Headline metrics for the user's logged attempts"""
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Attempts", stats['total_attempts'])
+    with col2:
+        st.metric("Avg Score", f"{average_score(stats)}%")
+    with col3:
+        st.metric("Best Score", stats['best_score'])
+    with col4:
+        st.metric("Time Spent", f"{stats['total_time'] // 60} min")
@@ -0,0 +1,58 @@
+import streamlit as st
+import pandas as pd
+from config.feature_config import BULK_IMPORT_ENABLED
+from utils.bulk_import import REQUIRED_COLUMNS, validate_students, create_accounts
+
+
+def bulk_import_page():
+    """Bulk student onboarding from a CSV roster"""
+    if not BULK_IMPORT_ENABLED:
+        st.error("Bulk import is not enabled.")
+        return
+
+    st.markdown("<h1>👥 Bulk Import</h1>", unsafe_allow_html=True)
+    st.markdown("Create accounts for a whole class from a CSV file.")
+
+    st.caption(
+        "Columns: " + ", ".join(REQUIRED_COLUMNS) + " (optional: country_code). "
+        "Dates use YYYY-MM-DD."
+    )
+
+    uploaded = st.file_uploader("Student roster", type=["csv"], key="bulk_import_file")
+    if uploaded is None:
+        return
+
+    try:
+        roster = pd.read_csv(uploaded, dtype=str, keep_default_na=False)
+        valid_df, errors_df = validate_students(roster)
+    except ValueError as e:
+        st.error(str(e))
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Ready to create", len(valid_df))
+    with col2:
+        st.metric("Invalid rows", len(errors_df))
+
+    if not errors_df.empty:
+        st.markdown("### Rows with errors")
+        st.dataframe(errors_df, use_container_width=True, hide_index=True)
+
+    if valid_df.empty:
+        return
+
+    if st.button(f"Create {len(valid_df)} Accounts", key="bulk_import_submit", use_container_width=True):
+        progress = st.progress(0.0, text="Creating accounts...")
+
+        def on_progress(done, total):
+            progress.progress(done / total, text=f"Created {done} of {total}")
+
+        failures = create_accounts(valid_df, on_progress=on_progress)
+
+        created = len(valid_df) - len(failures)
+        if created:
+            st.success(f"{created} account(s) created successfully!")
+        if failures:
+            st.error(f"{len(failures)} account(s) could not be created")
+            st.dataframe(pd.DataFrame(failures), use_container_width=True, hide_index=True)
@@ -1,10 +1,14 @@
 import streamlit as st
+from utils.attempt_store import sync_attempts
+from utils.attempt_stats import get_stats, average_score
 
 
 def dashboard_page():
     """Main dashboard after login"""
     user = st.session_state.user_data
 
+    stats = get_stats(user.get('user_id'))
+
     st.markdown(f"""
         <h1 style="text-align: left;">Welcome back, {user.get('first_name', 'User')}! 👋</h1>
         <p style="color: #787774; font-size: 0.95rem; margin-top: -0.5rem;">Grade {user.get('grade', 'N/A')} • {user.get('school_name', 'School')}</p>
@@ -13,20 +17,46 @@ def dashboard_page():
     st.markdown("---")
 
     # Quick Stats
+    stats_slot = st.empty()
+    with stats_slot.container():
+        _render_quick_stats(stats)
+
+    # Coming Soon
+    st.markdown("""
+        <div class="card" style="margin-top: 2rem;">
+            <h3>🚀 Dashboard Coming Soon!</h3>
+            <p style="color: #787774; margin-top: 0.5rem;">
+                We're building an amazing experience for you. Stay tuned!
+            </p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    # Refresh from the API only after the page has rendered, so a slow
+    # backend never holds up the saved stats
+    new_attempts = sync_attempts(user.get('user_id'))
+    if new_attempts:
+        with stats_slot.container():
+            _render_quick_stats(get_stats(user.get('user_id')))
+    elif new_attempts is None:
+        st.caption("Couldn't refresh your results right now. Showing saved stats.")
+
+
+def _render_quick_stats(stats):
+    """Tests taken, average score and streak cards"""
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        st.markdown("""
+        st.markdown(f"""
             <div class="card">
-                <div style="font-size: 1.5rem; font-weight: 600; color: #37352F;">0</div>
+                <div style="font-size: 1.5rem; font-weight: 600; color: #37352F;">{stats['total_attempts']}</div>
                 <div style="font-size: 0.875rem; color: #787774; margin-top: 0.25rem;">Tests Taken</div>
             </div>
         """, unsafe_allow_html=True)
 
     with col2:
-        st.markdown("""
+        st.markdown(f"""
             <div class="card">
-                <div style="font-size: 1.5rem; font-weight: 600; color: #37352F;">0%</div>
+                <div style="font-size: 1.5rem; font-weight: 600; color: #37352F;">{average_score(stats)}%</div>
                 <div style="font-size: 0.875rem; color: #787774; margin-top: 0.25rem;">Avg Score</div>
             </div>
         """, unsafe_allow_html=True)
@@ -38,13 +68,3 @@ def dashboard_page():
                 <div style="font-size: 0.875rem; color: #787774; margin-top: 0.25rem;">Day Streak</div>
             </div>
         """, unsafe_allow_html=True)
-
-    # Coming Soon
-    st.markdown("""
-        <div class="card" style="margin-top: 2rem;">
-            <h3>🚀 Dashboard Coming Soon!</h3>
-            <p style="color: #787774; margin-top: 0.5rem;">
-                We're building an amazing experience for you. Stay tuned!
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import streamlit as st
+from utils.attempt_store import sync_attempts, iter_attempts
+from utils.export import attempt_rows, stream_csv, stream_pdf
+
+
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv", stream_csv),
+    "PDF": ("pdf", "application/pdf", stream_pdf),
+}
+
+
+def render_export_section(key_prefix):
+    """Downloadable attempt history report"""
+    user = st.session_state.user_data
+
+    st.markdown("### Download Report")
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        fmt = st.selectbox("Format", list(EXPORT_FORMATS), key=f"{key_prefix}_export_format")
+    with col2:
+        st.markdown("<br>", unsafe_allow_html=True)
+        prepare = st.button("Prepare Report", key=f"{key_prefix}_export_prepare", use_container_width=True)
+
+    if not prepare:
+        return
+
+    extension, mime, writer = EXPORT_FORMATS[fmt]
+
+    # The report is generated chunk by chunk into a file on disk, so
+    # building it never holds the whole history in memory. Streamlit
+    # reads the file fully into memory once it is handed to the
+    # download button.
+    fd, path = tempfile.mkstemp(suffix=f".{extension}")
+    try:
+        with st.spinner("Preparing your report..."):
+            with os.fdopen(fd, "wb") as report:
+                if sync_attempts(user.get('user_id'), force=True) is None:
+                    st.error("Failed to load your attempt history. Please try again.")
+                    return
+
+                attempts = iter_attempts(user.get('user_id'))
+                for chunk in writer(attempt_rows(attempts)):
+                    report.write(chunk)
+
+        with open(path, "rb") as report:
+            st.download_button(
+                f"⬇️ Download {fmt}",
+                data=report,
+                file_name=f"olympiad_report.{extension}",
+                mime=mime,
+                key=f"{key_prefix}_export_download",
+                use_container_width=True
+            )
+    except Exception as e:
+        st.error("Failed to prepare your report. Please try again.")
+    finally:
+        os.remove(path)
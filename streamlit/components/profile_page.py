@@ -1,4 +1,13 @@
 import streamlit as st
+from components.export_section import render_export_section
+from utils.auth import get_user_info, update_user_info
+from utils.media import avatar_ref, avatar_data_uri, image_path
+
+# Fields accepted by PUT /user_info/{user_id}
+USER_INFO_FIELDS = [
+    "first_name", "last_name", "email", "date_of_birth", "country_code",
+    "phone_number", "profile_image", "school_name", "city", "state",
+]
 
 
 def profile_page():
@@ -6,6 +15,54 @@ def profile_page():
     user = st.session_state.user_data
     st.markdown("<h1>👤 Profile</h1>", unsafe_allow_html=True)
 
+    st.markdown("### Profile Photo")
+
+    col_photo, col_upload = st.columns([1, 3])
+    with col_photo:
+        avatar = image_path(avatar_ref(user), 128)
+        if avatar:
+            st.image(avatar, width=96)
+        else:
+            st.markdown(f"""
+                <div style="width: 96px; height: 96px; border-radius: 6px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); display: flex; align-items: center; justify-content: center; color: white; font-size: 2rem; font-weight: 600;">
+                    {user.get('first_name', 'U')[0].upper()}
+                </div>
+            """, unsafe_allow_html=True)
+    with col_upload:
+        photo = st.file_uploader("Upload a photo", type=["png", "jpg", "jpeg"], key="profile_photo")
+        if photo is not None and st.button("Save Photo", key="profile_photo_save"):
+            if photo.size > 5 * 1024 * 1024:
+                st.error("Image size must be less than 5MB")
+                return
+            try:
+                profile_image = avatar_data_uri(photo.getvalue())
+            except Exception as e:
+                st.error("Could not read that image. Please try another file.")
+                return
+
+            with st.spinner("Saving your photo..."):
+                # Build the update from the server's current profile, not the
+                # login-time session copy, so only the photo changes
+                response = get_user_info(user.get('user_id'))
+                if not response or response.status_code != 200:
+                    st.error("Failed to load your profile. Please try again.")
+                    return
+
+                current = response.json()
+                user_info = {
+                    field: current.get(field, '')
+                    for field in USER_INFO_FIELDS
+                }
+                user_info["profile_image"] = profile_image
+
+                response = update_user_info(user.get('user_id'), user_info)
+
+                if response and response.status_code == 200:
+                    user['profile_image'] = profile_image
+                    st.rerun()
+                else:
+                    st.error("Failed to update profile photo. Please try again.")
+
     st.markdown("### Your Information")
 
     col1, col2 = st.columns(2)
@@ -18,3 +75,6 @@ def profile_page():
         st.text_input("Last Name", value=user.get('last_name', ''), disabled=True)
         st.text_input("Grade", value=str(user.get('grade', '')), disabled=True)
         st.text_input("City", value=user.get('city', ''), disabled=True)
+
+    st.markdown("---")
+    render_export_section("profile")
@@ -1,4 +1,6 @@
 import streamlit as st
+from config.feature_config import BULK_IMPORT_ENABLED
+from utils.media import avatar_ref, image_data_uri
 
 
 def render_sidebar():
@@ -6,14 +8,20 @@ def render_sidebar():
 
     user = st.session_state.user_data
 
+    avatar_uri = image_data_uri(avatar_ref(user), 20)
+    if avatar_uri:
+        avatar_html = f'<img src="{avatar_uri}" style="width: 20px; height: 20px; border-radius: 3px; object-fit: cover;">'
+    else:
+        avatar_html = f'''<div style="width: 20px; height: 20px; border-radius: 3px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); display: flex; align-items: center; justify-content: center; color: white; font-size: 0.688rem; font-weight: 600;">
+                        {user.get('first_name', 'U')[0].upper()}
+                    </div>'''
+
     with st.sidebar:
         # User Profile Section - Compact Notion Style
         st.markdown(f"""
             <div style="padding: 0.375rem 0.5rem; margin-bottom: 0.25rem;">
                 <div style="display: flex; align-items: center; gap: 0.5rem;">
-                    <div style="width: 20px; height: 20px; border-radius: 3px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); display: flex; align-items: center; justify-content: center; color: white; font-size: 0.688rem; font-weight: 600;">
-                        {user.get('first_name', 'U')[0].upper()}
-                    </div>
+                    {avatar_html}
                     <div style="flex: 1; min-width: 0;">
                         <div style="font-size: 0.813rem; font-weight: 500; color: #37352F; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">
                             {user.get('first_name', 'User')}'s Workspace
@@ -68,6 +76,11 @@ def render_sidebar():
         st.markdown('<div class="sidebar-divider"></div>', unsafe_allow_html=True)
 
         # Settings & Profile
+        if BULK_IMPORT_ENABLED:
+            if st.button("👥 Bulk Import", key="nav_bulk_import", use_container_width=True):
+                st.session_state.active_nav = "Bulk Import"
+                st.rerun()
+
         if st.button("👤 Profile", key="nav_profile", use_container_width=True):
             st.session_state.active_nav = "Profile"
             st.rerun()
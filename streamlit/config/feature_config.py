@@ -0,0 +1,5 @@
+# Feature Flags
+
+# Bulk student import (teacher/batch mode). Accounts carry no
+# teacher/admin role yet, so this stays off for regular deployments.
+BULK_IMPORT_ENABLED = False
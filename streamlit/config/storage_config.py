@@ -0,0 +1,14 @@
+# Local Storage Configuration
+LOCAL_DATA_DIR = ".cache/olympiad"
+
+# Media cache
+MEDIA_CACHE_DIR = f"{LOCAL_DATA_DIR}/media"
+MEDIA_CACHE_MAX_BYTES = 50 * 1024 * 1024
+THUMBNAIL_SIZES = (32, 128, 512)
+MEDIA_FAILURE_TTL = 300
+
+# Practice attempt store
+ATTEMPT_STORE_DIR = f"{LOCAL_DATA_DIR}/attempts"
+ATTEMPT_SYNC_INTERVAL = 60
+ATTEMPT_PENDING_TTL = 3 * 60 * 60
+ATTEMPT_FETCH_TIMEOUT = 10
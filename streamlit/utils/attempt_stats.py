@@ -0,0 +1,85 @@
+import json
+import os
+import threading
+from itertools import islice
+from utils import attempt_store
+from utils.export import attempt_rows
+
+STATS_FILE = "stats.json"
+
+_lock = threading.Lock()
+
+
+def _stats_path(user_id):
+    return os.path.join(attempt_store.user_dir(user_id), STATS_FILE)
+
+
+def _empty_stats():
+    return {"total_attempts": 0, "total_time": 0, "total_score": 0, "total_questions": 0, "best_score": 0}
+
+
+def _load_stats(user_id):
+    try:
+        with open(_stats_path(user_id)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return _empty_stats()
+
+
+def _save_stats(user_id, stats):
+    path = _stats_path(user_id)
+    with open(path + ".tmp", "w") as f:
+        json.dump(stats, f)
+    os.replace(path + ".tmp", path)
+
+
+def _fold(stats, attempts):
+    for row in attempt_rows(attempts):
+        stats["total_attempts"] += 1
+        stats["total_time"] += row["time_spent_sec"]
+        stats["total_score"] += row["score"]
+        stats["total_questions"] += row["total_questions"]
+        stats["best_score"] = max(stats["best_score"], row["score"])
+    return stats
+
+
+def _rebuild(user_id, count):
+    """Recompute the summary from the first `count` logged attempts"""
+    stats = _fold(_empty_stats(), islice(attempt_store.iter_attempts(user_id), count))
+    _save_stats(user_id, stats)
+    return stats
+
+
+def get_stats(user_id):
+    """Running analytics summary for a user's logged attempts.
+
+    The summary is rebuilt from the log if it has fallen out of step,
+    e.g. after a crash between a sync and its update.
+    """
+    with _lock:
+        stats = _load_stats(user_id)
+        count = attempt_store.logged_count(user_id)
+        if stats["total_attempts"] != count:
+            stats = _rebuild(user_id, count)
+        return stats
+
+
+def average_score(stats):
+    """Average percentage of questions answered correctly"""
+    if not stats["total_questions"]:
+        return 0
+    return round(100 * stats["total_score"] / stats["total_questions"])
+
+
+def update_stats(user_id, new_attempts):
+    """Fold newly synced attempts into the stored summary"""
+    with _lock:
+        stats = _load_stats(user_id)
+        count = attempt_store.logged_count(user_id)
+        if stats["total_attempts"] + len(new_attempts) == count:
+            _save_stats(user_id, _fold(stats, new_attempts))
+        else:
+            _rebuild(user_id, count)
+
+
+attempt_store.subscribe(update_stats)
@@ -0,0 +1,159 @@
+import json
+import os
+import threading
+import time
+from config.storage_config import ATTEMPT_STORE_DIR, ATTEMPT_SYNC_INTERVAL, ATTEMPT_PENDING_TTL, ATTEMPT_FETCH_TIMEOUT
+from utils.practice import get_practice_attempts
+
+LOG_FILE = "attempts.jsonl"
+META_FILE = "meta.json"
+
+_lock = threading.Lock()
+_listeners = []
+
+
+def subscribe(listener):
+    """Register `listener(user_id, new_attempts)` to be called after each sync"""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def user_dir(user_id):
+    path = os.path.join(ATTEMPT_STORE_DIR, str(user_id))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _load_meta(user_id):
+    try:
+        with open(os.path.join(user_dir(user_id), META_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"high_water_mark": 0, "logged": [], "pending": {}, "synced_at": 0}
+
+
+def _save_meta(user_id, meta):
+    path = os.path.join(user_dir(user_id), META_FILE)
+    with open(path + ".tmp", "w") as f:
+        json.dump(meta, f)
+    os.replace(path + ".tmp", path)
+
+
+def _attempt_id(item):
+    return item['practice_exam_attempt_details'].get('practice_exam_attempt_details_id') or 0
+
+
+def _is_finished(item):
+    return bool(item['practice_exam_attempt_details'].get('end_time'))
+
+
+def sync_attempts(user_id, force=False, page_size=50):
+    """Fetch attempts not yet in the log and append them.
+
+    The API does not promise an order, so every page is deduped against
+    the logged ids. While the ids seen so far are strictly descending,
+    paging stops once it passes the high-water mark and any recent pending
+    attempt; otherwise all pages are scanned. Attempts still in progress
+    are tracked as pending and logged once they finish, if they turn up
+    on a page that is read. Pending attempts older than
+    ATTEMPT_PENDING_TTL are treated as abandoned and dropped. Returns the
+    list of newly logged attempts, or None if a page could not be fetched;
+    failed syncs are throttled like successful ones.
+    """
+    with _lock:
+        meta = _load_meta(user_id)
+        now = time.time()
+        if not force and now - meta["synced_at"] < ATTEMPT_SYNC_INTERVAL:
+            return []
+
+        logged = set(meta["logged"])
+        pending = {
+            int(attempt_id): first_seen
+            for attempt_id, first_seen in meta["pending"].items()
+            if now - first_seen < ATTEMPT_PENDING_TTL
+        }
+        # Only pending attempts within a page of the high-water mark hold
+        # the floor back, so an old abandoned attempt never forces a deep scan
+        floor = min([meta["high_water_mark"]] + [
+            p - 1 for p in pending if meta["high_water_mark"] - p < page_size
+        ])
+
+        new_attempts = {}
+        seen_max = meta["high_water_mark"]
+        last_id = None
+        descending = True
+        page = 1
+        while True:
+            response = get_practice_attempts(
+                user_id, page=page, page_size=page_size, timeout=ATTEMPT_FETCH_TIMEOUT
+            )
+            if not response or response.status_code != 200:
+                meta.update(synced_at=now)
+                _save_meta(user_id, meta)
+                return None
+
+            body = response.json()
+            reached_floor = False
+            for item in body.get('data', []):
+                if not item.get('practice_exam_attempt_details'):
+                    continue
+                attempt_id = _attempt_id(item)
+                if last_id is not None and attempt_id >= last_id:
+                    descending = False
+                last_id = attempt_id
+                seen_max = max(seen_max, attempt_id)
+                if attempt_id <= floor:
+                    reached_floor = True
+
+                if attempt_id in logged or attempt_id in new_attempts:
+                    continue
+                if _is_finished(item):
+                    new_attempts[attempt_id] = item
+                    pending.pop(attempt_id, None)
+                elif attempt_id > floor or attempt_id in pending:
+                    pending.setdefault(attempt_id, now)
+
+            pagination = body.get('pagination') or {}
+            if (descending and reached_floor) or not pagination.get('has_next'):
+                break
+            page += 1
+
+        new_attempts = [new_attempts[attempt_id] for attempt_id in sorted(new_attempts)]
+        if new_attempts:
+            with open(os.path.join(user_dir(user_id), LOG_FILE), "a") as f:
+                for item in new_attempts:
+                    f.write(json.dumps(item) + "\n")
+
+        logged.update(_attempt_id(item) for item in new_attempts)
+        meta.update(
+            high_water_mark=seen_max,
+            logged=sorted(logged),
+            pending={str(attempt_id): first_seen for attempt_id, first_seen in pending.items()},
+            synced_at=now
+        )
+        _save_meta(user_id, meta)
+
+    if new_attempts:
+        for listener in list(_listeners):
+            listener(user_id, new_attempts)
+    return new_attempts
+
+
+def logged_count(user_id):
+    """Number of attempts currently recorded in a user's log"""
+    return len(_load_meta(user_id)["logged"])
+
+
+def iter_attempts(user_id):
+    """Yield a user's logged attempts from disk in the order they were logged.
+
+    Each sync appends its batch by ascending attempt id, so the log is
+    oldest first except for attempts that finished after newer ones.
+    """
+    path = os.path.join(user_dir(user_id), LOG_FILE)
+    if not os.path.exists(path):
+        return
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -2,10 +2,10 @@ import requests
 from config.api_config import API_BASE_URL
 
 
-def signup_user(user_data):
+def signup_user(user_data, timeout=None):
     """Sign up a new user"""
     try:
-        response = requests.post(f"{API_BASE_URL}/signup", json=user_data)
+        response = requests.post(f"{API_BASE_URL}/signup", json=user_data, timeout=timeout)
         return response
     except Exception as e:
         return None
@@ -21,3 +21,21 @@ def login_user(email, password):
         return response
     except Exception as e:
         return None
+
+
+def get_user_info(user_id):
+    """Fetch a user's current profile information"""
+    try:
+        response = requests.get(f"{API_BASE_URL}/user_info/{user_id}")
+        return response
+    except Exception as e:
+        return None
+
+
+def update_user_info(user_id, user_info):
+    """Update a user's profile information"""
+    try:
+        response = requests.put(f"{API_BASE_URL}/user_info/{user_id}", json=user_info)
+        return response
+    except Exception as e:
+        return None
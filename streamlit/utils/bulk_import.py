@@ -0,0 +1,122 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pandas as pd
+from utils.auth import signup_user
+
+REQUIRED_COLUMNS = [
+    "first_name", "last_name", "email", "password", "grade", "date_of_birth",
+    "phone_number", "school_name", "city", "state",
+]
+
+MAX_WORKERS = 8
+MAX_RETRIES = 3
+RETRY_BACKOFF = 1.0
+SIGNUP_TIMEOUT = 15
+
+
+def validate_students(df):
+    """Validate a student roster in one vectorized pass.
+
+    Returns (valid_df, errors_df); errors_df has a `row` (1-based, as in
+    the CSV file) and an `error` column.
+    """
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    df = df.copy()
+    if "country_code" not in df.columns:
+        df["country_code"] = "+91"
+    text_cols = REQUIRED_COLUMNS + ["country_code"]
+    df[text_cols] = df[text_cols].fillna("").astype(str).apply(lambda col: col.str.strip())
+    df["email"] = df["email"].str.lower()
+
+    grade = pd.to_numeric(df["grade"], errors="coerce")
+    dob = pd.to_datetime(df["date_of_birth"], errors="coerce", format="%Y-%m-%d")
+
+    checks = [
+        ((df[REQUIRED_COLUMNS] == "").any(axis=1), "Missing required fields"),
+        (df["password"].str.len() < 6, "Password must be at least 6 characters long"),
+        (~df["email"].str.contains("@", regex=False), "Invalid email address"),
+        (df["email"].duplicated(keep="first"), "Duplicate email in file"),
+        (grade.isna() | (grade < 1) | (grade > 12) | (grade % 1 != 0), "Grade must be between 1 and 12"),
+        (dob.isna(), "Date of birth must be YYYY-MM-DD"),
+    ]
+
+    error = pd.Series("", index=df.index)
+    for mask, message in checks:
+        error = error.mask(mask & (error == ""), message)
+
+    invalid = error != ""
+    errors_df = pd.DataFrame({"row": df.index[invalid] + 2, "email": df.loc[invalid, "email"], "error": error[invalid]})
+
+    valid_df = df[~invalid].copy()
+    valid_df["grade"] = grade[~invalid].astype(int)
+    valid_df["date_of_birth"] = dob[~invalid].dt.strftime("%Y-%m-%d")
+    return valid_df, errors_df.reset_index(drop=True)
+
+
+def _signup_payload(row):
+    """Build a signup request body from a validated roster row"""
+    return {
+        "first_name": row["first_name"],
+        "last_name": row["last_name"],
+        "email": row["email"],
+        "password": row["password"],
+        "grade": int(row["grade"]),
+        "date_of_birth": row["date_of_birth"],
+        "country_code": row["country_code"],
+        "phone_number": row["phone_number"],
+        "profile_image": "",
+        "school_name": row["school_name"],
+        "city": row["city"],
+        "state": row["state"]
+    }
+
+
+def _signup_with_retry(user_data):
+    """Create one account, retrying network errors and server failures.
+
+    Signup is not idempotent: after a timeout or server error the account
+    may already exist, so a later 400 is not reported as a plain conflict.
+    """
+    uncertain = False
+    for attempt in range(MAX_RETRIES):
+        response = signup_user(user_data, timeout=SIGNUP_TIMEOUT)
+
+        if response is not None and response.status_code == 201:
+            return None
+        if response is not None and response.status_code == 400:
+            if uncertain:
+                return "Account may already exist (an earlier attempt did not complete)"
+            return "Email already registered or invalid data"
+        if response is not None and response.status_code < 500 and response.status_code != 429:
+            return f"Signup failed ({response.status_code})"
+
+        if response is None or response.status_code >= 500:
+            uncertain = True
+        if attempt < MAX_RETRIES - 1:
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+    return "Failed to create account after retries"
+
+
+def create_accounts(valid_df, on_progress=None, max_workers=MAX_WORKERS):
+    """Create accounts for validated rows with bounded concurrency.
+
+    `on_progress(done, total)` is called from the calling thread after
+    each row finishes. Returns a list of {"email", "error"} failures.
+    """
+    rows = valid_df.to_dict("records")
+    failures = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_signup_with_retry, _signup_payload(row)): row for row in rows}
+        for done, future in enumerate(as_completed(futures), start=1):
+            error = future.result()
+            if error:
+                failures.append({"email": futures[future]["email"], "error": error})
+            if on_progress:
+                on_progress(done, len(rows))
+
+    return failures
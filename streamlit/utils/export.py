@@ -0,0 +1,141 @@
+import csv
+import io
+
+REPORT_COLUMNS = [
+    "date", "exam", "section", "topic", "difficulty",
+    "score", "total_questions", "correct", "incorrect", "time_spent_sec",
+]
+
+# PDF layout (US Letter, Courier, fixed-width columns)
+PDF_PAGE_WIDTH = 612
+PDF_PAGE_HEIGHT = 792
+PDF_MARGIN = 40
+PDF_FONT_SIZE = 7
+PDF_LINE_HEIGHT = 10
+PDF_ROWS_PER_PAGE = (PDF_PAGE_HEIGHT - 2 * PDF_MARGIN) // PDF_LINE_HEIGHT - 3
+PDF_COLUMN_WIDTHS = [20, 18, 16, 28, 8, 5, 5, 5, 5, 6]
+PDF_HEADER = {
+    "date": "Date", "exam": "Exam", "section": "Section", "topic": "Topic",
+    "difficulty": "Level", "score": "Score", "total_questions": "Qs",
+    "correct": "Right", "incorrect": "Wrong", "time_spent_sec": "Secs",
+}
+
+
+def attempt_rows(attempts):
+    """Flatten practice exam attempts into report rows"""
+    for item in attempts:
+        details = item.get('practice_exam_attempt_details') or {}
+        que_ans = details.get('que_ans_details') or []
+        correct = sum(1 for q in que_ans if q.get('status') == 1)
+        incorrect = sum(1 for q in que_ans if q.get('status') == 2)
+        total = len((item.get('questions') or {}).get('question_ids') or []) or len(que_ans)
+
+        topic = (item.get('syllabus') or {}).get('topic') or f"Topic {item.get('syllabus_id')}"
+        subtopic = (item.get('syllabus') or {}).get('subtopic')
+
+        yield {
+            "date": details.get('end_time') or details.get('start_time') or item.get('created_at', ''),
+            "exam": (item.get('exam_overview') or {}).get('exam') or f"Exam {item.get('exam_overview_id')}",
+            "section": (item.get('section') or {}).get('section') or f"Section {item.get('section_id')}",
+            "topic": f"{topic} - {subtopic}" if subtopic else topic,
+            "difficulty": item.get('difficulty', ''),
+            "score": details.get('score') or correct,
+            "total_questions": total,
+            "correct": correct,
+            "incorrect": incorrect,
+            "time_spent_sec": details.get('total_time') or 0,
+        }
+
+
+def stream_csv(rows):
+    """Yield a CSV report as encoded chunks, one row at a time"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=REPORT_COLUMNS)
+
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= 64 * 1024:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue().encode("utf-8")
+
+
+def _pdf_text(value):
+    """Escape a value for a PDF string literal in the standard font encoding"""
+    text = str(value).encode("latin-1", "replace").decode("latin-1")
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _pdf_line(row):
+    """Format one report row as a fixed-width text line"""
+    cells = [str(row[col])[:w].ljust(w) for col, w in zip(REPORT_COLUMNS, PDF_COLUMN_WIDTHS)]
+    return " ".join(cells)
+
+
+def _pdf_page_content(title, page_number, lines):
+    """Build the content stream for one report page"""
+    y = PDF_PAGE_HEIGHT - PDF_MARGIN
+    ops = [f"BT /F1 {PDF_FONT_SIZE} Tf {PDF_LINE_HEIGHT} TL {PDF_MARGIN} {y} Td"]
+    ops.append(f"({_pdf_text(f'{title} - page {page_number}')}) Tj T* T*")
+    for line in lines:
+        ops.append(f"({_pdf_text(line)}) Tj T*")
+    ops.append("ET")
+    return "\n".join(ops).encode("latin-1")
+
+
+def stream_pdf(rows, title="Performance Report"):
+    """Yield a paged PDF report as encoded chunks, one page at a time.
+
+    Object 1 is the catalog, 2 the page tree and 3 the font; page objects
+    follow in pairs. The page tree and xref are written last, so only the
+    object offsets are kept in memory while pages are streamed.
+    """
+    offsets = {}
+    position = 0
+    page_ids = []
+
+    def emit(obj_id, body):
+        nonlocal position
+        offsets[obj_id] = position
+        chunk = f"{obj_id} 0 obj\n".encode("latin-1") + body + b"\nendobj\n"
+        position += len(chunk)
+        return chunk
+
+    header = b"%PDF-1.4\n"
+    position += len(header)
+    yield header
+    yield emit(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+    yield emit(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier >>")
+
+    def page_chunks(lines):
+        content_id = 4 + 2 * len(page_ids)
+        page_id = content_id + 1
+        page_ids.append(page_id)
+        stream = _pdf_page_content(title, len(page_ids), [_pdf_line(PDF_HEADER)] + lines)
+        yield emit(content_id, f"<< /Length {len(stream)} >>\nstream\n".encode("latin-1") + stream + b"\nendstream")
+        yield emit(page_id, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PDF_PAGE_WIDTH} {PDF_PAGE_HEIGHT}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode("latin-1"))
+
+    lines = []
+    for row in rows:
+        lines.append(_pdf_line(row))
+        if len(lines) == PDF_ROWS_PER_PAGE:
+            yield from page_chunks(lines)
+            lines = []
+    if lines or not page_ids:
+        yield from page_chunks(lines)
+
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    yield emit(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode("latin-1"))
+
+    xref_start = position
+    size = max(offsets) + 1
+    xref = [f"xref\n0 {size}\n", "0000000000 65535 f \n"]
+    xref += [f"{offsets[obj_id]:010d} 00000 n \n" for obj_id in range(1, size)]
+    xref.append(f"trailer\n<< /Size {size} /Root 1 0 R >>\nstartxref\n{xref_start}\n%%EOF\n")
+    yield "".join(xref).encode("latin-1")
@@ -0,0 +1,229 @@
+import base64
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+import requests
+from PIL import Image, ImageOps
+from config.storage_config import MEDIA_CACHE_DIR, MEDIA_CACHE_MAX_BYTES, MEDIA_FAILURE_TTL, THUMBNAIL_SIZES
+
+INDEX_FILE = "index.json"
+
+
+class MediaCache:
+    """Content-addressed image cache with LRU eviction by total bytes.
+
+    Only thumbnails are kept, as `<sha256>_<size>.png` where the digest
+    is of the source image. `index.json` maps image refs (http(s) URLs or
+    `data:` URIs, the latter keyed by their hash) to digests, so a source
+    is fetched or decoded at most once while its thumbnails stay cached.
+    """
+
+    def __init__(self, root=MEDIA_CACHE_DIR, max_bytes=MEDIA_CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+        # Least recently used first, rebuilt from file mtimes
+        entries = []
+        for name in os.listdir(root):
+            if name == INDEX_FILE:
+                continue
+            stat = os.stat(os.path.join(root, name))
+            entries.append((stat.st_mtime, name, stat.st_size))
+        self._files = OrderedDict((name, size) for _, name, size in sorted(entries))
+        self._total = sum(self._files.values())
+
+        try:
+            with open(os.path.join(root, INDEX_FILE)) as f:
+                self._refs = json.load(f)
+        except (OSError, ValueError):
+            self._refs = {}
+
+        # Refs that failed to load, with the time of the failure
+        self._failures = {}
+
+    def _path(self, name):
+        return os.path.join(self.root, name)
+
+    def _touch(self, name):
+        self._files.move_to_end(name)
+        os.utime(self._path(name))
+
+    def _write(self, name, data):
+        with open(self._path(name), "wb") as f:
+            f.write(data)
+        self._total += len(data) - self._files.pop(name, 0)
+        self._files[name] = len(data)
+
+    def _evict(self, keep):
+        while self._total > self.max_bytes and len(self._files) > len(keep):
+            name = next(n for n in self._files if n not in keep)
+            self._total -= self._files.pop(name)
+            try:
+                os.remove(self._path(name))
+            except OSError:
+                pass
+
+    def _save_refs(self):
+        with open(self._path(INDEX_FILE), "w") as f:
+            json.dump(self._refs, f)
+
+    def _store(self, data, digest=None, max_size=None):
+        """Generate and store thumbnails of an image, returning the digest"""
+        digest = digest or hashlib.sha256(data).hexdigest()
+        written = []
+
+        image = ImageOps.exif_transpose(Image.open(io.BytesIO(data)))
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        for size in THUMBNAIL_SIZES:
+            if max_size and size > max_size:
+                break
+            thumb = image.copy()
+            thumb.thumbnail((size, size))
+            buffer = io.BytesIO()
+            thumb.save(buffer, format="PNG", optimize=True)
+            written.append(f"{digest}_{size}.png")
+            self._write(written[-1], buffer.getvalue())
+
+        self._evict(keep=set(written))
+        return digest
+
+    def put(self, data, ref=None):
+        """Add image bytes to the cache, optionally under an image ref"""
+        with self._lock:
+            digest = self._store(data)
+            if ref:
+                self._refs[_ref_key(ref)] = digest
+                self._save_refs()
+            return digest
+
+    def variant_path(self, digest, size):
+        """Path of a stored thumbnail for a digest"""
+        return self._path(f"{digest}_{size}.png")
+
+    def _fetch(self, ref):
+        """Load the source bytes for a ref, or None if unavailable"""
+        if ref.startswith("data:"):
+            try:
+                return base64.b64decode(ref.split(",", 1)[1])
+            except (IndexError, ValueError):
+                return None
+        if not ref.startswith(("http://", "https://")):
+            return None
+        try:
+            response = requests.get(ref, timeout=10)
+        except Exception as e:
+            return None
+        if response.status_code != 200:
+            return None
+        return response.content
+
+    def get(self, ref, size):
+        """Return the path of the smallest cached variant covering `size`.
+
+        `ref` is an image URL or `data:` URI. Returns None if the image
+        cannot be loaded; failures are remembered for MEDIA_FAILURE_TTL
+        seconds so a dead URL is not re-requested on every rerun.
+        """
+        if not ref:
+            return None
+        size = next((s for s in THUMBNAIL_SIZES if s >= size), THUMBNAIL_SIZES[-1])
+        key = _ref_key(ref)
+
+        with self._lock:
+            if time.time() - self._failures.get(key, 0) < MEDIA_FAILURE_TTL:
+                return None
+
+            digest = self._refs.get(key)
+            name = f"{digest}_{size}.png"
+            if digest and name in self._files:
+                self._touch(name)
+                return self._path(name)
+
+            # Variant evicted: rebuild from a larger one if still cached,
+            # since thumbnails never upscale
+            for source in reversed(THUMBNAIL_SIZES):
+                if source < size:
+                    break
+                if digest and f"{digest}_{source}.png" in self._files:
+                    with open(self._path(f"{digest}_{source}.png"), "rb") as f:
+                        self._store(f.read(), digest=digest, max_size=source)
+                    return self._path(name)
+
+        data = self._fetch(ref)
+        try:
+            digest = self.put(data, ref=ref) if data is not None else None
+        except Exception as e:
+            digest = None
+
+        if digest is None:
+            with self._lock:
+                self._failures[key] = time.time()
+            return None
+        return self._path(f"{digest}_{size}.png")
+
+
+def _ref_key(ref):
+    """Index key for an image ref; data URIs are keyed by their hash"""
+    if ref.startswith("data:"):
+        return "data:" + hashlib.sha256(ref.encode("utf-8")).hexdigest()
+    return ref
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_media_cache():
+    """Shared media cache for the app process"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = MediaCache()
+        return _cache
+
+
+def avatar_ref(user):
+    """Image reference for a user's avatar"""
+    return user.get('profile_image')
+
+
+def avatar_data_uri(data, size=128):
+    """Downscale an uploaded photo to a JPEG data URI for `profile_image`.
+
+    The avatar is never shown larger than 128 px, so that thumbnail is
+    what gets stored on the server. The encoded avatar is cached under
+    the URI, so it is served without decoding it again.
+    """
+    cache = get_media_cache()
+    digest = cache.put(data)
+
+    with Image.open(cache.variant_path(digest, size)) as image:
+        avatar = image.convert("RGBA")
+    background = Image.new("RGB", avatar.size, "white")
+    background.paste(avatar, mask=avatar.getchannel("A"))
+    buffer = io.BytesIO()
+    background.save(buffer, format="JPEG", quality=85)
+
+    uri = "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+    cache.put(buffer.getvalue(), ref=uri)
+    return uri
+
+
+def image_path(ref, size):
+    """Path to the smallest cached variant of an image covering `size` px"""
+    return get_media_cache().get(ref, size)
+
+
+def image_data_uri(ref, size):
+    """Inline data URI for small images embedded in HTML"""
+    path = image_path(ref, size)
+    if not path:
+        return None
+    with open(path, "rb") as f:
+        return "data:image/png;base64," + base64.b64encode(f.read()).decode("ascii")
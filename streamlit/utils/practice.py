@@ -0,0 +1,15 @@
+import requests
+from config.api_config import API_BASE_URL
+
+
+def get_practice_attempts(user_id, page=1, page_size=50, timeout=None):
+    """Fetch one page of a user's practice exam attempts"""
+    try:
+        response = requests.get(f"{API_BASE_URL}/user_practice_exam/{user_id}", params={
+            "page": page,
+            "page_size": page_size
+        }, timeout=timeout)
+        return response
+    except Exception as e:
+        return None
+